@@ -5,15 +5,13 @@ Comprehensive process management tool replacing shell scripts.
 Provides both structured JSON output and human-readable dashboard.
 No external dependencies required - uses only Python standard library.
 """
+import asyncio
 import json
 import sys
 import argparse
 from process_status.git_utils import update_git_state
 from process_status.core import collect_all_data
-from process_status.display import (
-    print_dashboard_header, print_prs_table, print_copilot_issues,
-    print_recommended_actions, print_dashboard_footer, print_detailed_pr_analysis
-)
+from process_status.display import print_dashboard
 
 def main():
     parser = argparse.ArgumentParser(description="Process Status Dashboard")
@@ -21,6 +19,8 @@ def main():
                        help="Display human-readable dashboard instead of JSON")
     parser.add_argument("--no-update", action="store_true",
                        help="Skip git fetch/pull operations")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Ignore the on-disk PR cache and refetch all PR data")
     
     args = parser.parse_args()
     
@@ -29,19 +29,15 @@ def main():
         update_git_state()
     
     # Collect all data
-    data = collect_all_data()
+    data = asyncio.run(collect_all_data(use_cache=not args.no_cache))
     
     if args.dashboard:
         # Human-readable dashboard
-        print_dashboard_header(data)
-        print_prs_table(data.get('prs', []))
-        print_detailed_pr_analysis(data.get('prs', []))
-        print_copilot_issues(data.get('copilot_issues', []))
-        print_recommended_actions(data.get('recommended_actions', []))
-        print_dashboard_footer()
+        print_dashboard(data)
     else:
         # Structured JSON output
-        print(json.dumps(data, indent=2))
+        json.dump(data, sys.stdout, indent=2)
+        sys.stdout.write("\n")
 
 if __name__ == "__main__":
     main()
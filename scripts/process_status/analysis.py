@@ -2,56 +2,60 @@
 Progress analysis utilities for process status tracking.
 """
 import datetime
+import functools
+import re
+import time
+
+# Commit message keywords that signal a PR's stage
+_READY_RE = re.compile(r"Complete|Ready for review|Implementation complete")
+_PLANNING_RE = re.compile(r"Initial plan|WIP")
+
+# Reference time for elapsed calculations, shared across one dashboard run
+_NOW = None
+
+def snapshot_now():
+    """Capture the current time as the reference for elapsed calculations."""
+    global _NOW
+    _NOW = time.time()
+    return _NOW
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp):
+    """Parse an ISO timestamp into epoch seconds."""
+    return datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
 
 def get_elapsed_minutes(created_at):
     """Calculate elapsed minutes from ISO timestamp."""
     try:
-        created_dt = datetime.datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-        now = datetime.datetime.now(datetime.timezone.utc)
-        elapsed = (now - created_dt).total_seconds() / 60
-        return int(elapsed)
+        now = _NOW if _NOW is not None else time.time()
+        return int((now - _parse_timestamp(created_at)) / 60)
     except Exception:
         return 0
 
-def pr_status(commit_msg, is_draft, additions=0, deletions=0):
-    """Determine PR status based on commit message, draft status, and changes."""
+def classify_pr(commit_msg, is_draft, mergeable, elapsed, additions=0, deletions=0):
+    """Determine a PR's status, the action it needs and that action's priority.
+    
+    Returns a (status, action, priority) tuple.
+    """
     # Check for substantial implementation (more than just yarn.lock changes)
     has_implementation = (additions + deletions) > 1000 and not (additions == 3510 and deletions == 5146)
     
-    if any(x in commit_msg for x in ["Complete", "Ready for review", "Implementation complete"]) and not is_draft:
-        return "ready_for_review"
-    elif is_draft and not has_implementation:
-        return "planning"
-    elif is_draft and has_implementation:
-        return "draft"
-    elif any(x in commit_msg for x in ["Initial plan", "WIP"]):
-        return "planning"
-    elif has_implementation:
-        return "in_progress"
+    if not is_draft and _READY_RE.search(commit_msg):
+        status = "ready_for_review"
+    elif is_draft:
+        status = "draft" if has_implementation else "planning"
+    elif has_implementation and not _PLANNING_RE.search(commit_msg):
+        status = "in_progress"
     else:
-        return "planning"
-
-def action_needed(mergeable, status, elapsed):
-    """Determine what action is needed for a PR."""
+        status = "planning"
+    
     if mergeable == "CONFLICTING":
-        return "resolve_conflicts"
+        return status, "resolve_conflicts", "high"
     elif status == "ready_for_review" and mergeable == "MERGEABLE":
-        return "review_ready"
-    elif status == "planning" and elapsed > 30:
-        return "investigate"
-    elif elapsed > 60:
-        return "investigate"
-    return "wait"
-
-def priority_for_action(action):
-    """Determine priority level for an action."""
-    if action == "resolve_conflicts":
-        return "high"
-    elif action == "review_ready":
-        return "medium"
-    elif action == "investigate":
-        return "medium"
-    return "normal"
+        return status, "review_ready", "medium"
+    elif elapsed > 60 or (status == "planning" and elapsed > 30):
+        return status, "investigate", "medium"
+    return status, "wait", "normal"
 
 def analyze_copilot_progress(issue_num, pr_data, branch_progress):
     """Analyze progress of a GitHub Copilot assigned issue."""
@@ -77,15 +81,16 @@ def analyze_copilot_progress(issue_num, pr_data, branch_progress):
             "message": "PR contains only yarn.lock changes - may indicate setup phase or blocked work"
         }
     
-    status = pr_status(latest_commit, pr_data.get('isDraft', False), additions, deletions)
-    action = action_needed(pr_data.get('mergeable', 'UNKNOWN'), status, elapsed)
-    priority = priority_for_action(action)
+    status, action, priority = classify_pr(
+        latest_commit, pr_data.get('isDraft', False), pr_data.get('mergeable', 'UNKNOWN'),
+        elapsed, additions, deletions
+    )
     
     return {
         "status": status,
         "action": action,
         "priority": priority,
         "elapsed_minutes": elapsed,
-        "commit_count": branch_progress.get('commits', 0),
+        "commit_count": pr_data.get('commitCount', 0),
         "latest_commit": latest_commit
     }
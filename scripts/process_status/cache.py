@@ -0,0 +1,50 @@
+"""
+On-disk cache of open PR data for process status tracking.
+"""
+import functools
+import json
+import os
+import re
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+from .git_utils import run
+
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'process_status')
+
+# "owner/repo" at the end of an https, ssh or scp-style remote URL
+_REMOTE_REPO_RE = re.compile(r'([^/:]+)/([^/:]+?)(?:\.git)?/?$')
+
+@functools.lru_cache(maxsize=None)
+def cache_file():
+    """Path of the PR cache for the current repository, keyed by origin's owner/repo."""
+    match = _REMOTE_REPO_RE.search(run(["git", "config", "--get", "remote.origin.url"], check=False) or "")
+    name = f"prs-{match.group(1)}-{match.group(2)}.json" if match else "prs.json"
+    return os.path.join(CACHE_DIR, name)
+
+def load(version):
+    """Load cached PR data keyed by PR number, or an empty dict if unavailable.
+
+    A cache written with a different version is treated as a miss.
+    """
+    try:
+        with open(cache_file(), 'rb') as f:
+            data = _loads(f.read())
+        if data.get('version') != version:
+            return {}
+        return {int(pr_num): pr for pr_num, pr in data['prs'].items()}
+    except (OSError, ValueError, AttributeError, KeyError):
+        return {}
+
+def save(prs, version):
+    """Atomically replace the cache with PR data keyed by PR number."""
+    target = cache_file()
+    tmp_file = f"{target}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_file, 'w') as f:
+            json.dump({"version": version, "prs": prs}, f)
+        os.replace(tmp_file, target)
+    except OSError:
+        pass
@@ -1,22 +1,26 @@
 """
 Core data collection and analysis for process status tracking.
 """
-import datetime
+import asyncio
 import concurrent.futures
-import threading
-import sys
-from .github_utils import (
-    get_open_prs, get_pr_data, get_copilot_assigned_issues, 
-    find_related_pr, get_issue_data, get_pr_changes, get_pr_commits,
-    get_pr_review_readiness_analysis
-)
-from .git_utils import get_branch_progress, run
-from .analysis import get_elapsed_minutes, pr_status, action_needed, priority_for_action, analyze_copilot_progress
+import datetime
+from .github_utils import GhClient, get_pr_review_readiness_analysis
+from .git_utils import clear_caches, get_branch_progress, run
+from .analysis import get_elapsed_minutes, analyze_copilot_progress, snapshot_now
+
+# Worker threads for blocking git/gh calls; these are I/O-bound, not CPU-bound
+MAX_WORKERS = 16
 
-def collect_git_status():
+def _run_blocking(func, *args):
+    """Run a blocking call in the worker pool and return an awaitable."""
+    return asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+async def collect_git_status():
     """Collect current git repository status."""
-    current_branch = run("git branch --show-current", check=False)
-    last_commit = run("git log -1 --format='%h %s'", check=False)
+    current_branch, last_commit = await asyncio.gather(
+        _run_blocking(run, ["git", "branch", "--show-current"], False),
+        _run_blocking(run, ["git", "log", "-1", "--format=%h %s"], False)
+    )
     
     return {
         "current_branch": current_branch or "unknown",
@@ -24,166 +28,90 @@ def collect_git_status():
         "last_updated": datetime.datetime.now(datetime.timezone.utc).isoformat()
     }
 
-def collect_pr_data():
-    """Collect and analyze all open PR data with parallel execution."""
-    pr_numbers = get_open_prs()
-    if not pr_numbers:
-        return []
+def analyze_pr(pr_data, branch_progress):
+    """Build the dashboard entry for a PR, including its readiness analysis."""
+    title = pr_data.get("title", "")
+    is_draft = pr_data.get("isDraft", False)
+    mergeable = pr_data.get("mergeable", "UNKNOWN")
+    created_at = pr_data.get("createdAt", None)
+    branch = pr_data.get("headRefName", "")
+    additions = pr_data.get("additions", 0)
+    deletions = pr_data.get("deletions", 0)
+    commits = pr_data.get("commits", [])
+    
+    elapsed = get_elapsed_minutes(created_at) if created_at else 0
+    commit_msg = commits[-1].get("messageHeadline", "") if commits else ""
+    
+    readiness_analysis = get_pr_review_readiness_analysis(pr_data)
+    status = "ready_for_review" if readiness_analysis["ready_for_review"] else "draft" if is_draft else "in_progress"
+    action = readiness_analysis["recommendation"]
+    priority = "high" if action in ["resolve_conflicts", "convert_to_ready"] else "medium" if action == "review_ready" else "normal"
     
-    prs = []
-    
-    # Use ThreadPoolExecutor for parallel data collection
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        # Submit all PR data collection tasks
-        future_to_pr = {
-            executor.submit(get_pr_data, pr_num): pr_num 
-            for pr_num in pr_numbers
-        }
-        
-        # Submit readiness analysis tasks
-        readiness_futures = {
-            executor.submit(get_pr_review_readiness_analysis, pr_num): pr_num
-            for pr_num in pr_numbers
+    return {
+        "pr_number": pr_data.get("number"),
+        "title": title,
+        "is_draft": is_draft,
+        "mergeable": mergeable,
+        "branch": branch,
+        "elapsed_minutes": elapsed,
+        "latest_commit_msg": commit_msg,
+        "pr_status": status,
+        "action_needed": action,
+        "priority": priority,
+        "additions": additions,
+        "deletions": deletions,
+        "commit_count": pr_data.get("commitCount", len(commits)),
+        "branch_progress": branch_progress,
+        "readiness_analysis": {
+            "ready": readiness_analysis["ready_for_review"],
+            "confidence": readiness_analysis["confidence"],
+            "reasons": readiness_analysis["reasons"],
+            "recommendation": readiness_analysis["recommendation"],
+            "file_analysis": {
+                "files_changed": readiness_analysis["stats"]["files_changed"],
+                "has_real_implementation": readiness_analysis["analysis"]["has_real_implementation"],
+                "yarn_lock_only": readiness_analysis["analysis"]["yarn_lock_only"]
+            },
+            "commit_analysis": {
+                "has_completion_indicators": readiness_analysis["analysis"]["has_completion_indicators"],
+                "latest_messages": readiness_analysis["analysis"]["latest_commit_messages"]
+            }
         }
-        
-        # Collect results
-        pr_data_results = {}
-        readiness_results = {}
-        
-        # Get PR data
-        for future in concurrent.futures.as_completed(future_to_pr):
-            pr_num = future_to_pr[future]
-            try:
-                pr_data_results[pr_num] = future.result()
-            except Exception as e:
-                print(f"Error collecting data for PR {pr_num}: {e}", file=sys.stderr)
-                pr_data_results[pr_num] = None
-        
-        # Get readiness analysis
-        for future in concurrent.futures.as_completed(readiness_futures):
-            pr_num = readiness_futures[future]
-            try:
-                readiness_results[pr_num] = future.result()
-            except Exception as e:
-                print(f"Error analyzing readiness for PR {pr_num}: {e}", file=sys.stderr)
-                readiness_results[pr_num] = None
+    }
+
+async def collect_pr_data(prs_future):
+    """Analyze all open PRs once the batched PR data is available."""
+    prs_by_number = await prs_future
     
-    # Process results
-    for pr_num in pr_numbers:
-        pr_data = pr_data_results.get(pr_num)
-        readiness_analysis = readiness_results.get(pr_num)
-        
-        if pr_data:
-            title = pr_data.get("title", "")
-            is_draft = pr_data.get("isDraft", False)
-            mergeable = pr_data.get("mergeable", "UNKNOWN")
-            created_at = pr_data.get("createdAt", None)
-            branch = pr_data.get("headRefName", "")
-            additions = pr_data.get("additions", 0)
-            deletions = pr_data.get("deletions", 0)
-            
-            elapsed = get_elapsed_minutes(created_at) if created_at else 0
-            branch_progress = get_branch_progress(branch)
-            commit_msg = branch_progress.get("latest_commit", "")
-            
-            # Use readiness analysis if available, otherwise fall back to basic analysis
-            if readiness_analysis and not readiness_analysis.get("error"):
-                status = "ready_for_review" if readiness_analysis["ready_for_review"] else "draft" if is_draft else "in_progress"
-                action = readiness_analysis["recommendation"]
-                priority = "high" if action in ["resolve_conflicts", "convert_to_ready"] else "medium" if action == "review_ready" else "normal"
-                
-                # Enhanced PR data with readiness analysis
-                pr_entry = {
-                    "pr_number": pr_num,
-                    "title": title,
-                    "is_draft": is_draft,
-                    "mergeable": mergeable,
-                    "branch": branch,
-                    "elapsed_minutes": elapsed,
-                    "latest_commit_msg": commit_msg,
-                    "pr_status": status,
-                    "action_needed": action,
-                    "priority": priority,
-                    "additions": additions,
-                    "deletions": deletions,
-                    "commit_count": len(get_pr_commits(pr_num)),
-                    "branch_progress": branch_progress,
-                    "readiness_analysis": {
-                        "ready": readiness_analysis["ready_for_review"],
-                        "confidence": readiness_analysis["confidence"],
-                        "reasons": readiness_analysis["reasons"],
-                        "recommendation": readiness_analysis["recommendation"],
-                        "file_analysis": {
-                            "files_changed": readiness_analysis["stats"]["files_changed"],
-                            "has_real_implementation": readiness_analysis["analysis"]["has_real_implementation"],
-                            "yarn_lock_only": readiness_analysis["analysis"]["yarn_lock_only"]
-                        },
-                        "commit_analysis": {
-                            "has_completion_indicators": readiness_analysis["analysis"]["has_completion_indicators"],
-                            "latest_messages": readiness_analysis["analysis"]["latest_commit_messages"]
-                        }
-                    }
-                }
-            else:
-                # Fallback to basic analysis
-                status = pr_status(commit_msg, is_draft, additions, deletions)
-                action = action_needed(mergeable, status, elapsed)
-                priority = priority_for_action(action)
-                
-                pr_entry = {
-                    "pr_number": pr_num,
-                    "title": title,
-                    "is_draft": is_draft,
-                    "mergeable": mergeable,
-                    "branch": branch,
-                    "elapsed_minutes": elapsed,
-                    "latest_commit_msg": commit_msg,
-                    "pr_status": status,
-                    "action_needed": action,
-                    "priority": priority,
-                    "additions": additions,
-                    "deletions": deletions,
-                    "commit_count": len(get_pr_commits(pr_num)),
-                    "branch_progress": branch_progress,
-                    "readiness_analysis": None
-                }
-            
-            prs.append(pr_entry)
-        else:
-            prs.append({
-                "pr_number": pr_num,
-                "error": "PR not found",
-                "action_needed": "investigate",
-                "priority": "high"
-            })
+    async def fetch_and_analyze_pr(pr_data):
+        branch_progress = await _run_blocking(get_branch_progress, pr_data.get("headRefName", ""))
+        return analyze_pr(pr_data, branch_progress)
     
-    return prs
+    return await asyncio.gather(*(fetch_and_analyze_pr(pr_data) for pr_data in prs_by_number.values()))
 
-def collect_copilot_issues():
+async def collect_copilot_issues(gh, prs_future):
     """Collect and analyze GitHub Copilot assigned issues."""
-    issues = []
-    copilot_issue_nums = get_copilot_assigned_issues()
+    copilot_issues = await _run_blocking(gh.get_copilot_assigned_issues)
+    if not copilot_issues:
+        return []
     
-    for issue_num in copilot_issue_nums:
-        issue_data = get_issue_data(issue_num)
-        if not issue_data:
-            continue
-        
+    async def analyze_issue(issue_data):
+        issue_num = issue_data["number"]
         title = issue_data.get("title", "")
-        created_at = issue_data.get("createdAt", None)
         
-        # Find related PR
-        related_pr_num = find_related_pr(issue_num)
-        pr_data = get_pr_data(related_pr_num) if related_pr_num else None
+        # Find related PR in the batched PR data
+        await prs_future
+        related_pr_num = gh.find_related_pr(issue_num)
+        pr_data = gh.get_pr_data(related_pr_num) if related_pr_num else None
         
         # Get branch progress if PR exists
         branch = pr_data.get("headRefName", "") if pr_data else ""
-        branch_progress = get_branch_progress(branch) if branch else {}
+        branch_progress = await _run_blocking(get_branch_progress, branch) if branch else {}
         
         # Analyze progress
         progress_analysis = analyze_copilot_progress(issue_num, pr_data, branch_progress)
         
-        issues.append({
+        return {
             "issue_number": issue_num,
             "title": title,
             "related_pr": related_pr_num,
@@ -196,21 +124,31 @@ def collect_copilot_issues():
                 "latest_commit": progress_analysis.get("latest_commit", "")
             },
             "message": progress_analysis.get("message", "")
-        })
+        }
     
-    return issues
+    return await asyncio.gather(*(analyze_issue(issue_data) for issue_data in copilot_issues))
 
 def generate_summary(prs, issues):
     """Generate summary statistics."""
-    # PR summary
-    blocked_count = sum(1 for pr in prs if pr.get("mergeable") == "CONFLICTING")
-    ready_count = sum(1 for pr in prs if pr.get("pr_status") == "ready_for_review" and pr.get("mergeable") == "MERGEABLE")
-    investigate_count = sum(1 for pr in prs if pr.get("elapsed_minutes", 0) > 45)
+    # PR summary in a single pass
+    blocked_count = ready_count = investigate_count = 0
+    for pr in prs:
+        mergeable = pr.get("mergeable")
+        if mergeable == "CONFLICTING":
+            blocked_count += 1
+        elif mergeable == "MERGEABLE" and pr.get("pr_status") == "ready_for_review":
+            ready_count += 1
+        if pr.get("elapsed_minutes", 0) > 45:
+            investigate_count += 1
     normal_count = len(prs) - blocked_count - ready_count - investigate_count
     
-    # Issue summary
-    copilot_active = len([i for i in issues if i.get("status") in ["in_progress", "draft"]])
-    copilot_blocked = len([i for i in issues if i.get("action") == "investigate"])
+    # Issue summary in a single pass
+    copilot_active = copilot_blocked = 0
+    for issue in issues:
+        if issue.get("status") in ("in_progress", "draft"):
+            copilot_active += 1
+        if issue.get("action") == "investigate":
+            copilot_blocked += 1
     
     return {
         "blocked_count": blocked_count,
@@ -272,19 +210,29 @@ def generate_recommendations(prs, issues, summary):
     
     return recommended
 
-def collect_all_data():
+async def collect_all_data(use_cache=True):
     """Collect all process status data."""
-    # Core data collection
-    git_status = collect_git_status()
-    prs = collect_pr_data()
-    issues = collect_copilot_issues()
+    now = snapshot_now()
+    clear_caches()
+    asyncio.get_running_loop().set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    )
+    
+    # Core data collection; the three phases overlap and share one PR fetch
+    gh = GhClient()
+    prs_future = _run_blocking(gh.fetch_open_prs, use_cache)
+    git_status, prs, issues = await asyncio.gather(
+        collect_git_status(),
+        collect_pr_data(prs_future),
+        collect_copilot_issues(gh, prs_future)
+    )
     
     # Analysis
     summary = generate_summary(prs, issues)
     recommendations = generate_recommendations(prs, issues, summary)
     
     return {
-        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "timestamp": datetime.datetime.fromtimestamp(now, datetime.timezone.utc).isoformat(),
         "dashboard_type": "process_management",
         "git_status": git_status,
         "prs": prs,
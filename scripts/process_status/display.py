@@ -1,6 +1,8 @@
 """
 Display utilities for process status dashboard.
 """
+import functools
+import sys
 
 # ANSI color codes
 RED = '\033[31m'
@@ -41,34 +43,67 @@ ACTION_ICONS = {
     "convert_to_ready": f"{GREEN}🚀{RESET}"
 }
 
+# Pre-rendered colored labels for known statuses and actions
+_STATUS_COLORED = {
+    status: f"{color}{status}{RESET}"
+    for status, color in (
+        ("ready_for_review", GREEN),
+        ("draft", YELLOW),
+        ("planning", YELLOW),
+        ("in_progress", CYAN),
+        ("blocked", RED),
+        ("error", RED),
+        ("yarn_lock_only", RED),
+        ("no_pr", BLUE),
+    )
+}
+
+_ACTION_COLORED = {
+    action: f"{color}{action}{RESET}"
+    for action, color in (
+        ("resolve_conflicts", RED),
+        ("review_ready", GREEN),
+        ("convert_to_ready", GREEN),
+        ("investigate", YELLOW),
+        ("wait", CYAN),
+        ("check_branch_activity", CYAN),
+    )
+}
+
+# Follow-up hint printed under a PR's detailed analysis, by recommendation
+_RECOMMENDATION_HINTS = {
+    "convert_to_ready": f"  {GREEN}💡 Suggested command:{RESET} gh pr ready {{pr_num}}",
+    "review_ready": f"  {GREEN}👀 Ready for review!{RESET}",
+    "resolve_conflicts": f"  {RED}⚡ Conflicts need resolution{RESET}"
+}
+
+def _build_cells(icons, colored, width):
+    """Precompose 'icon label' table cells, padding the colored label to width."""
+    return {key: f"{icons.get(key, '')} {colored.get(key, key):<{width}}" for key in icons.keys() | colored.keys()}
+
+def _cell(cells, key, width):
+    """Look up a precomposed cell, formatting unknown keys without icon or color."""
+    cell = cells.get(key)
+    return cell if cell is not None else f" {key:<{width}}"
+
+# Precomposed table cells, keyed by status/action/priority
+_PR_STATUS_CELLS = _build_cells(STATUS_ICONS, _STATUS_COLORED, 15)
+_ISSUE_STATUS_CELLS = _build_cells(STATUS_ICONS, _STATUS_COLORED, 17)
+_ACTION_CELLS = _build_cells(ACTION_ICONS, _ACTION_COLORED, 17)
+_PRIORITY_CELLS = _build_cells(PRIORITY_ICONS, {}, 7)
+
+_PR_TABLE_HEADER = f"{'#':<5} {'Title':<35} {'Status':<18} {'Action':<20} {'Priority':<10} {'Elapsed':<10} {'Analysis':<15}"
+_ISSUE_TABLE_HEADER = f"{'#':<5} {'Title':<40} {'Status':<20} {'Progress':<15} {'Action':<20}"
+
 def color_status(status):
     """Apply color coding to status text."""
-    if status == "ready_for_review":
-        return f"{GREEN}{status}{RESET}"
-    elif status in ["draft", "planning"]:
-        return f"{YELLOW}{status}{RESET}"
-    elif status == "in_progress":
-        return f"{CYAN}{status}{RESET}"
-    elif status == "blocked":
-        return f"{RED}{status}{RESET}"
-    elif status in ["error", "yarn_lock_only"]:
-        return f"{RED}{status}{RESET}"
-    elif status == "no_pr":
-        return f"{BLUE}{status}{RESET}"
-    return status
+    return _STATUS_COLORED.get(status, status)
 
 def color_action(action):
     """Apply color coding to action text."""
-    if action == "resolve_conflicts":
-        return f"{RED}{action}{RESET}"
-    elif action in ["review_ready", "convert_to_ready"]:
-        return f"{GREEN}{action}{RESET}"
-    elif action == "investigate":
-        return f"{YELLOW}{action}{RESET}"
-    elif action in ["wait", "check_branch_activity"]:
-        return f"{CYAN}{action}{RESET}"
-    return action
+    return _ACTION_COLORED.get(action, action)
 
+@functools.lru_cache(maxsize=512)
 def format_elapsed_time(minutes):
     """Format elapsed time in a human-readable way."""
     if minutes < 60:
@@ -82,32 +117,31 @@ def format_elapsed_time(minutes):
         remaining_hours = (minutes % 1440) // 60
         return f"{days}d{remaining_hours}h"
 
-def print_dashboard_header(data):
-    """Print the dashboard header with summary information."""
-    print(f"\n{BOLD}==== PROCESS DASHBOARD ===={RESET}")
-    print(f"{CYAN}Timestamp:{RESET} {data['timestamp']}")
+def render_dashboard_header(data, out):
+    """Render the dashboard header with summary information."""
+    out.append(f"\n{BOLD}==== PROCESS DASHBOARD ===={RESET}")
+    out.append(f"{CYAN}Timestamp:{RESET} {data['timestamp']}")
     
     if 'git_status' in data:
         git_status = data['git_status']
-        print(f"{CYAN}Git Status:{RESET} {git_status.get('current_branch', 'unknown')} | Updated: {git_status.get('last_updated', 'unknown')}")
+        out.append(f"{CYAN}Git Status:{RESET} {git_status.get('current_branch', 'unknown')} | Updated: {git_status.get('last_updated', 'unknown')}")
     
     summary = data.get('summary', {})
-    print(f"{BOLD}Total PRs:{RESET} {summary.get('total_prs', 0)}")
-    print(f"{RED}Blocked:{RESET} {summary.get('blocked_count', 0)} | "
-          f"{GREEN}Ready:{RESET} {summary.get('ready_for_review_count', 0)} | "
-          f"{YELLOW}Investigation:{RESET} {summary.get('needs_investigation_count', 0)} | "
-          f"{CYAN}Normal:{RESET} {summary.get('normal_progress_count', 0)}")
+    out.append(f"{BOLD}Total PRs:{RESET} {summary.get('total_prs', 0)}")
+    out.append(f"{RED}Blocked:{RESET} {summary.get('blocked_count', 0)} | "
+               f"{GREEN}Ready:{RESET} {summary.get('ready_for_review_count', 0)} | "
+               f"{YELLOW}Investigation:{RESET} {summary.get('needs_investigation_count', 0)} | "
+               f"{CYAN}Normal:{RESET} {summary.get('normal_progress_count', 0)}")
 
-def print_prs_table(prs):
-    """Print the PRs in a formatted table with enhanced analysis."""
+def render_prs_table(prs, out, details):
+    """Render the PRs in a formatted table, collecting detail lines for PRs needing attention."""
     if not prs:
-        print(f"\n{DIM}No open PRs found.{RESET}")
+        out.append(f"\n{DIM}No open PRs found.{RESET}")
         return
     
-    print(f"\n{BOLD}Pull Requests:{RESET}")
-    header = f"{'#':<5} {'Title':<35} {'Status':<18} {'Action':<20} {'Priority':<10} {'Elapsed':<10} {'Analysis':<15}"
-    print(header)
-    print('-' * len(header))
+    out.append(f"\n{BOLD}Pull Requests:{RESET}")
+    out.append(_PR_TABLE_HEADER)
+    out.append('-' * len(_PR_TABLE_HEADER))
     
     for pr in prs:
         pr_num = pr.get('pr_number', '')
@@ -129,83 +163,69 @@ def print_prs_table(prs):
         else:
             analysis_summary = "basic"
         
-        status_icon = STATUS_ICONS.get(status, '')
-        priority_icon = PRIORITY_ICONS.get(priority, '')
-        action_icon = ACTION_ICONS.get(action, '')
-        
-        status_colored = color_status(status)
-        action_colored = color_action(action)
+        status_cell = _cell(_PR_STATUS_CELLS, status, 15)
+        action_cell = _cell(_ACTION_CELLS, action, 17)
+        priority_cell = _cell(_PRIORITY_CELLS, priority, 7)
         elapsed_formatted = format_elapsed_time(elapsed)
         
-        print(f"{str(pr_num):<5} {title[:33]:<35} {status_icon} {status_colored:<15} "
-              f"{action_icon} {action_colored:<17} {priority_icon} {priority:<7} "
-              f"{elapsed_formatted:<10} {analysis_summary:<15}")
+        out.append(f"{str(pr_num):<5} {title:<35.33} {status_cell} {action_cell} {priority_cell} "
+                   f"{elapsed_formatted:<10} {analysis_summary:<15}")
+        
+        if readiness and priority in ('high', 'medium'):
+            render_pr_details(pr, readiness, details)
 
-def print_detailed_pr_analysis(prs):
-    """Print detailed analysis for PRs that need attention."""
-    attention_prs = [pr for pr in prs if pr.get('priority') in ['high', 'medium'] and pr.get('readiness_analysis')]
+def render_pr_details(pr, readiness, out):
+    """Render the detailed readiness analysis for a single PR."""
+    pr_num = pr.get('pr_number', '')
+    title = pr.get('title', '')
     
-    if not attention_prs:
-        return
+    out.append(f"\n{CYAN}PR #{pr_num}: {title:.50}...{RESET}")
     
-    print(f"\n{BOLD}Detailed PR Analysis:{RESET}")
+    # Recommendation
+    recommendation = readiness.get('recommendation', 'unknown')
+    confidence = readiness.get('confidence', 'unknown')
+    out.append(f"  {BOLD}Recommendation:{RESET} {color_action(recommendation)} ({confidence} confidence)")
     
-    for pr in attention_prs:
-        pr_num = pr.get('pr_number', '')
-        title = pr.get('title', '')
-        readiness = pr.get('readiness_analysis', {})
-        
-        print(f"\n{CYAN}PR #{pr_num}: {title[:50]}...{RESET}")
-        
-        # Recommendation
-        recommendation = readiness.get('recommendation', 'unknown')
-        confidence = readiness.get('confidence', 'unknown')
-        print(f"  {BOLD}Recommendation:{RESET} {color_action(recommendation)} ({confidence} confidence)")
-        
-        # Reasons
-        reasons = readiness.get('reasons', [])
-        if reasons:
-            print(f"  {BOLD}Reasons:{RESET}")
-            for reason in reasons:
-                print(f"    • {reason}")
-        
-        # File analysis
-        file_analysis = readiness.get('file_analysis', {})
-        files_changed = file_analysis.get('files_changed', 0)
-        has_impl = file_analysis.get('has_real_implementation', False)
-        yarn_only = file_analysis.get('yarn_lock_only', False)
-        
-        print(f"  {BOLD}Files:{RESET} {files_changed} changed")
-        if yarn_only:
-            print(f"    {YELLOW}⚠️  Only yarn.lock changes detected{RESET}")
-        elif has_impl:
-            print(f"    {GREEN}✅ Real implementation detected{RESET}")
-        
-        # Latest commits
-        commit_analysis = readiness.get('commit_analysis', {})
-        latest_messages = commit_analysis.get('latest_messages', [])
-        if latest_messages:
-            print(f"  {BOLD}Recent commits:{RESET}")
-            for msg in latest_messages[-2:]:  # Show last 2 commits
-                print(f"    • {msg[:60]}...")
-        
-        # Action needed
-        if recommendation == "convert_to_ready":
-            print(f"  {GREEN}💡 Suggested command:{RESET} gh pr ready {pr_num}")
-        elif recommendation == "review_ready":
-            print(f"  {GREEN}👀 Ready for review!{RESET}")
-        elif recommendation == "resolve_conflicts":
-            print(f"  {RED}⚡ Conflicts need resolution{RESET}")
+    # Reasons
+    reasons = readiness.get('reasons', [])
+    if reasons:
+        out.append(f"  {BOLD}Reasons:{RESET}")
+        for reason in reasons:
+            out.append(f"    • {reason}")
+    
+    # File analysis
+    file_analysis = readiness.get('file_analysis', {})
+    files_changed = file_analysis.get('files_changed', 0)
+    has_impl = file_analysis.get('has_real_implementation', False)
+    yarn_only = file_analysis.get('yarn_lock_only', False)
+    
+    out.append(f"  {BOLD}Files:{RESET} {files_changed} changed")
+    if yarn_only:
+        out.append(f"    {YELLOW}⚠️  Only yarn.lock changes detected{RESET}")
+    elif has_impl:
+        out.append(f"    {GREEN}✅ Real implementation detected{RESET}")
+    
+    # Latest commits
+    commit_analysis = readiness.get('commit_analysis', {})
+    latest_messages = commit_analysis.get('latest_messages', [])
+    if latest_messages:
+        out.append(f"  {BOLD}Recent commits:{RESET}")
+        for msg in latest_messages[-2:]:  # Show last 2 commits
+            out.append(f"    • {msg:.60}...")
+    
+    # Action needed
+    hint = _RECOMMENDATION_HINTS.get(recommendation)
+    if hint:
+        out.append(hint.format(pr_num=pr_num))
 
-def print_copilot_issues(issues):
-    """Print GitHub Copilot assigned issues."""
+def render_copilot_issues(issues, out):
+    """Render GitHub Copilot assigned issues."""
     if not issues:
         return
     
-    print(f"\n{BOLD}GitHub Copilot Issues:{RESET}")
-    header = f"{'#':<5} {'Title':<40} {'Status':<20} {'Progress':<15} {'Action':<20}"
-    print(header)
-    print('-' * len(header))
+    out.append(f"\n{BOLD}GitHub Copilot Issues:{RESET}")
+    out.append(_ISSUE_TABLE_HEADER)
+    out.append('-' * len(_ISSUE_TABLE_HEADER))
     
     for issue in issues:
         issue_num = issue.get('issue_number', '')
@@ -214,25 +234,22 @@ def print_copilot_issues(issues):
         progress = issue.get('progress', {})
         action = issue.get('action', '')
         
-        status_icon = STATUS_ICONS.get(status, '')
-        action_icon = ACTION_ICONS.get(action, '')
-        
-        status_colored = color_status(status)
-        action_colored = color_action(action)
+        status_cell = _cell(_ISSUE_STATUS_CELLS, status, 17)
+        action_cell = _cell(_ACTION_CELLS, action, 17)
         
         commits = progress.get('commit_count', 0)
         elapsed = progress.get('elapsed_minutes', 0)
         progress_str = f"{commits}c/{format_elapsed_time(elapsed)}"
         
-        print(f"{str(issue_num):<5} {title[:38]:<40} {status_icon} {status_colored:<17} "
-              f"{progress_str:<15} {action_icon} {action_colored:<17}")
+        out.append(f"{str(issue_num):<5} {title:<40.38} {status_cell} "
+                   f"{progress_str:<15} {action_cell}")
 
-def print_recommended_actions(actions):
-    """Print recommended actions with priorities."""
+def render_recommended_actions(actions, out):
+    """Render recommended actions with priorities."""
     if not actions:
         return
     
-    print(f"\n{BOLD}Recommended Actions:{RESET}")
+    out.append(f"\n{BOLD}Recommended Actions:{RESET}")
     for rec in actions:
         action = rec.get('action', '')
         priority = rec.get('priority', '')
@@ -244,15 +261,30 @@ def print_recommended_actions(actions):
         action_icon = ACTION_ICONS.get(action, '')
         
         if next_check:
-            print(f"- {priority_icon} [{priority}] {action_icon} {action} (Next check in {next_check} min)")
+            out.append(f"- {priority_icon} [{priority}] {action_icon} {action} (Next check in {next_check} min)")
         elif count != '':
-            print(f"- {priority_icon} [{priority}] {action_icon} {action} ({count} items)")
+            out.append(f"- {priority_icon} [{priority}] {action_icon} {action} ({count} items)")
         else:
-            print(f"- {priority_icon} [{priority}] {action_icon} {action}")
+            out.append(f"- {priority_icon} [{priority}] {action_icon} {action}")
         
         if message:
-            print(f"  {DIM}{message}{RESET}")
+            out.append(f"  {DIM}{message}{RESET}")
+
+def render_dashboard_footer(out):
+    """Render the dashboard footer."""
+    out.append(f"{BOLD}==========================={RESET}\n")
 
-def print_dashboard_footer():
-    """Print the dashboard footer."""
-    print(f"{BOLD}==========================={RESET}\n")
+def print_dashboard(data):
+    """Render the full dashboard and write it to stdout in a single call."""
+    out = []
+    render_dashboard_header(data, out)
+    details = []
+    render_prs_table(data.get('prs', []), out, details)
+    if details:
+        out.append(f"\n{BOLD}Detailed PR Analysis:{RESET}")
+        out.extend(details)
+    render_copilot_issues(data.get('copilot_issues', []), out)
+    render_recommended_actions(data.get('recommended_actions', []), out)
+    render_dashboard_footer(out)
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
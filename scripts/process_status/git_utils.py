@@ -1,45 +1,92 @@
 """
 Git utilities for process status tracking.
 """
+import functools
 import subprocess
 import sys
+import threading
 
-def run(cmd, check=True):
-    """Run a shell command and return stdout or None on error."""
+# (latest commit subject, author date) per origin branch, loaded once per run
+_BRANCH_TIP_CACHE = None
+_BRANCH_TIP_LOCK = threading.Lock()
+# One lock per branch so concurrent progress lookups for it run git only once
+_BRANCH_PROGRESS_LOCKS = {}
+_BRANCH_PROGRESS_LOCKS_LOCK = threading.Lock()
+
+def run(argv, check=True, text=True):
+    """Run a command given as an argv list and return stdout or None on error.
+
+    With text=False stdout is returned as undecoded bytes, which JSON parsers
+    accept directly.
+    """
     try:
-        result = subprocess.run(cmd, shell=True, check=check, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        result = subprocess.run(argv, check=check, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=text)
         return result.stdout.strip()
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, OSError):
         return None
 
 def update_git_state():
-    """Update git state with fetch --all and pull."""
+    """Update git state with a single parallel fetch --all and a fast-forward."""
     print("🔄 Updating git state...", file=sys.stderr)
     
-    # Fetch all remotes and branches
-    fetch_result = run("git fetch --all", check=False)
+    # Fetch all remotes and branches once; branch lookups read these refs
+    fetch_result = run(["git", "fetch", "--all", "--prune", "--jobs=8"])
     if fetch_result is None:
         print("⚠️  Warning: git fetch --all failed", file=sys.stderr)
     
-    # Pull current branch if possible
-    current_branch = run("git branch --show-current", check=False)
+    # Fast-forward the current branch from the refs just fetched; a pull
+    # would fetch the same branch from origin a second time
+    current_branch = run(["git", "branch", "--show-current"], check=False)
     if current_branch:
-        pull_result = run(f"git pull origin {current_branch}", check=False)
-        if pull_result is None:
-            print(f"⚠️  Warning: git pull origin {current_branch} failed (may be on remote-only branch)", file=sys.stderr)
+        merge_result = run(["git", "merge", "--ff-only", f"origin/{current_branch}"])
+        if merge_result is None:
+            print(f"⚠️  Warning: fast-forward to origin/{current_branch} failed (branch diverged or has no remote)", file=sys.stderr)
     
     print("✅ Git state updated", file=sys.stderr)
 
+def clear_caches():
+    """Forget memoized branch lookups so the next run re-reads git state."""
+    global _BRANCH_TIP_CACHE
+    with _BRANCH_TIP_LOCK:
+        _BRANCH_TIP_CACHE = None
+    with _BRANCH_PROGRESS_LOCKS_LOCK:
+        _BRANCH_PROGRESS_LOCKS.clear()
+    _branch_progress.cache_clear()
+
+def _load_all_branch_tips():
+    """Read the latest commit subject and date of every origin branch in one git call."""
+    global _BRANCH_TIP_CACHE
+    with _BRANCH_TIP_LOCK:
+        if _BRANCH_TIP_CACHE is None:
+            output = run(["git", "for-each-ref", "--format=%(refname:lstrip=3)%09%(authordate:iso)%09%(contents:subject)", "refs/remotes/origin/"], check=False)
+            tips = {}
+            for line in (output or "").split('\n'):
+                branch, _, rest = line.partition('\t')
+                if branch:
+                    date, _, subject = rest.partition('\t')
+                    tips[branch] = (subject, date)
+            _BRANCH_TIP_CACHE = tips
+        return _BRANCH_TIP_CACHE
+
 def get_branch_progress(branch_name):
-    """Get progress info for a feature branch."""
+    """Get progress info for a feature branch, computing it once per branch per run."""
+    with _BRANCH_PROGRESS_LOCKS_LOCK:
+        lock = _BRANCH_PROGRESS_LOCKS.setdefault(branch_name, threading.Lock())
+    with lock:
+        return _branch_progress(branch_name)
+
+@functools.lru_cache(maxsize=None)
+def _branch_progress(branch_name):
+    """Read progress info for a feature branch from the fetched refs."""
     if not branch_name:
         return {"commits": 0, "latest_commit": "", "last_activity": ""}
     
-    # Ensure we have the latest branch info
-    run(f"git fetch origin {branch_name}", check=False)
+    # Subject and date come from the batched ref listing; only the count needs its own call
+    tip = _load_all_branch_tips().get(branch_name)
+    latest_commit, last_activity = tip if tip else ("", "")
     
     # Get commit count
-    commit_count = run(f"git rev-list --count origin/{branch_name} 2>/dev/null", check=False)
+    commit_count = run(["git", "rev-list", "--count", f"origin/{branch_name}"], check=False)
     if commit_count:
         try:
             commit_count = int(commit_count)
@@ -48,18 +95,6 @@ def get_branch_progress(branch_name):
     else:
         commit_count = 0
     
-    # Get latest commit message
-    latest_commit = run(f"git log origin/{branch_name} --oneline -1 2>/dev/null", check=False)
-    if latest_commit:
-        # Extract just the commit message (remove hash)
-        parts = latest_commit.split(' ', 1)
-        latest_commit = parts[1] if len(parts) > 1 else latest_commit
-    else:
-        latest_commit = ""
-    
-    # Get last activity time
-    last_activity = run(f"git log origin/{branch_name} --format=%ai -1 2>/dev/null", check=False)
-    
     return {
         "commits": commit_count,
         "latest_commit": latest_commit,
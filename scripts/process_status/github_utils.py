@@ -1,174 +1,213 @@
 """
 GitHub API utilities for process status tracking.
 """
-import json
 import re
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+from . import cache
 from .git_utils import run
 
-def get_open_prs():
-    """Get list of open PR numbers."""
-    prs_json = run("gh pr list --state open --json number")
-    if not prs_json:
-        return []
-    try:
-        return [pr['number'] for pr in json.loads(prs_json)]
-    except Exception:
-        return []
+# Any "#123" / "# 123" reference; also covers "Fixes #123"
+_ISSUE_RE = re.compile(r'#\s*(\d+)\b')
 
-def get_pr_data(pr_num):
-    """Get comprehensive PR data."""
-    pr_data_json = run(f"gh pr view {pr_num} --json number,title,isDraft,mergeable,headRefName,updatedAt,createdAt,state,assignees,body,additions,deletions")
-    if not pr_data_json:
-        return None
-    try:
-        return json.loads(pr_data_json)
-    except Exception:
-        return None
+# Commit message phrases that signal completion or early planning
+COMPLETION_INDICATORS = (
+    "Complete", "Ready for review", "Implementation complete",
+    "Final", "Done", "Finished", "All requirements met",
+    "Feature complete", "Implementation done"
+)
 
-def get_issue_data(issue_num):
-    """Get comprehensive issue data."""
-    issue_data_json = run(f"gh issue view {issue_num} --json number,title,assignees,createdAt,state,body")
-    if not issue_data_json:
-        return None
-    try:
-        return json.loads(issue_data_json)
-    except Exception:
-        return None
+PLANNING_INDICATORS = (
+    "Initial plan", "WIP", "Work in progress", "Planning",
+    "Analysis", "Setup", "Preparation", "Initial"
+)
 
-def get_copilot_assigned_issues():
-    """Get issues assigned to GitHub Copilot."""
-    issues_json = run("gh issue list --state open --json number,assignees")
-    if not issues_json:
-        return []
+# Matched against lowercased commit messages
+_COMPLETION_RE = re.compile("|".join(re.escape(s.lower()) for s in COMPLETION_INDICATORS))
+_PLANNING_RE = re.compile("|".join(re.escape(s.lower()) for s in PLANNING_INDICATORS))
+
+# Bump when OPEN_PRS_QUERY or the PR shape built from it changes, so
+# entries cached under the old shape are refetched
+PRS_CACHE_VERSION = 2
+
+OPEN_PRS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: OPEN, first: 100, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        number title isDraft mergeable headRefName createdAt updatedAt body additions deletions changedFiles
+        commits(last: 3) { totalCount nodes { commit { messageHeadline } } }
+        # Paths are capped at one page; changedFiles carries the full count
+        files(first: 100) { nodes { path additions deletions } }
+      }
+    }
+  }
+}
+"""
+
+def fetch_all_prs_graphql():
+    """Fetch all open PRs with commits and files in a single GraphQL query.
+
+    Returns a dict keyed by PR number. Commits and files are flattened into
+    the same shape `gh pr view --json` uses.
+    """
+    result = run(["gh", "api", "graphql", "-F", "owner={owner}", "-F", "name={repo}", "-f", f"query={OPEN_PRS_QUERY}"], text=False)
+    if not result:
+        return {}
     try:
-        issues = json.loads(issues_json)
-        copilot_issues = []
-        for issue in issues:
-            for assignee in issue.get('assignees', []):
-                if assignee.get('login') == 'Copilot':
-                    copilot_issues.append(issue['number'])
-                    break
-        return copilot_issues
+        nodes = _loads(result)['data']['repository']['pullRequests']['nodes']
     except Exception:
-        return []
+        return {}
+    prs = {}
+    for pr in nodes:
+        commits = pr.get('commits') or {}
+        pr['commits'] = [node['commit'] for node in commits.get('nodes', [])]
+        pr['commitCount'] = commits.get('totalCount', len(pr['commits']))
+        pr['files'] = (pr.get('files') or {}).get('nodes', [])
+        prs[pr['number']] = pr
+    return prs
 
-def find_related_pr(issue_num):
-    """Find PR related to an issue by checking PR bodies for issue references."""
-    prs_json = run("gh pr list --state open --json number,body")
-    if not prs_json:
+def get_open_pr_versions():
+    """Get number, updatedAt and mergeable for each open PR, or None on error."""
+    prs_json = run(["gh", "pr", "list", "--state", "open", "--limit", "100", "--json", "number,updatedAt,mergeable"], text=False)
+    if prs_json is None:
         return None
     try:
-        prs = json.loads(prs_json)
-        for pr in prs:
-            body = pr.get('body', '')
-            # Look for #issue_num references
-            if re.search(rf'#\s*{issue_num}\b', body) or re.search(rf'Fixes\s+#{issue_num}\b', body, re.IGNORECASE):
-                return pr['number']
-        return None
+        return _loads(prs_json) if prs_json else []
     except Exception:
         return None
 
-def get_pr_commits(pr_num):
-    """Get commits for a PR."""
-    commits_json = run(f"gh pr view {pr_num} --json commits")
-    if not commits_json:
+def _index_issue_references(prs):
+    """Map each issue number referenced in a PR body to the newest PR referencing it."""
+    index = {}
+    for pr_num in sorted(prs, reverse=True):
+        for issue_ref in _ISSUE_RE.findall(prs[pr_num].get('body') or ''):
+            index.setdefault(int(issue_ref), pr_num)
+    return index
+
+def _load_open_prs(use_cache):
+    """Get all open PR data, skipping the GraphQL query when no PR has changed.
+
+    PRs whose updatedAt matches the on-disk cache are served from it, with
+    mergeable refreshed since it can change without the PR being updated.
+    """
+    if not use_cache:
+        return fetch_all_prs_graphql()
+    
+    versions = get_open_pr_versions()
+    cached = cache.load(PRS_CACHE_VERSION)
+    if versions is not None and all(
+        cached.get(v['number'], {}).get('updatedAt') == v['updatedAt'] for v in versions
+    ):
+        prs = {}
+        for v in versions:
+            pr = cached[v['number']]
+            pr['mergeable'] = v.get('mergeable', pr.get('mergeable'))
+            prs[v['number']] = pr
+        return prs
+    
+    prs = fetch_all_prs_graphql()
+    if prs:
+        cache.save(prs, PRS_CACHE_VERSION)
+    return prs
+
+def _fetch_copilot_assigned_issues():
+    """Get data for all open issues assigned to GitHub Copilot in one call."""
+    issues_json = run(["gh", "issue", "list", "--state", "open", "--json", "number,title,assignees"], text=False)
+    if not issues_json:
         return []
     try:
-        data = json.loads(commits_json)
-        return data.get('commits', [])
+        return [
+            issue for issue in _loads(issues_json)
+            if any(assignee.get('login') == 'Copilot' for assignee in issue.get('assignees', ()))
+        ]
     except Exception:
         return []
 
-def get_pr_changes(pr_num):
-    """Get file changes for a PR."""
-    changes_json = run(f"gh pr diff {pr_num} --name-only")
-    if not changes_json:
-        return []
-    return changes_json.split('\n') if changes_json else []
-
-def get_pr_detailed_changes(pr_num):
-    """Get detailed change statistics for a PR."""
-    # Get file-by-file changes
-    changes_output = run(f"gh pr diff {pr_num} --stat", check=False)
-    
-    # Parse the output to extract file changes
-    files_changed = []
-    if changes_output:
-        lines = changes_output.split('\n')
-        for line in lines:
-            if '|' in line and ('+' in line or '-' in line):
-                parts = line.split('|')
-                if len(parts) >= 2:
-                    filename = parts[0].strip()
-                    stats = parts[1].strip()
-                    files_changed.append({
-                        "file": filename,
-                        "changes": stats
-                    })
-    
-    return files_changed
-
-def check_pr_readiness(pr_num):
+class GhClient:
+    """Batched, memoized GitHub lookups for one dashboard run."""
+    
+    def __init__(self):
+        # Open PR data keyed by PR number
+        self._prs = {}
+        # Issue number -> newest open PR whose body references it, built with _prs
+        self._issue_to_pr = {}
+        # Copilot-assigned issues, fetched on first use
+        self._issues = None
+    
+    def fetch_open_prs(self, use_cache=True):
+        """Fetch all open PR data and keep it for lookups during this run."""
+        self._prs = _load_open_prs(use_cache)
+        self._issue_to_pr = _index_issue_references(self._prs)
+        return self._prs
+    
+    def get_pr_data(self, pr_num):
+        """Get data for an open PR from the batched fetch."""
+        return self._prs.get(pr_num)
+    
+    def find_related_pr(self, issue_num):
+        """Find the open PR whose body references an issue, preferring the newest."""
+        return self._issue_to_pr.get(issue_num)
+    
+    def get_copilot_assigned_issues(self):
+        """Get data for all open issues assigned to GitHub Copilot."""
+        if self._issues is None:
+            self._issues = _fetch_copilot_assigned_issues()
+        return self._issues
+
+def check_pr_readiness(pr_data):
     """Check if a PR is actually ready for review by analyzing commits and changes."""
     # Get the latest commits to see completion indicators
-    commits = get_pr_commits(pr_num)
+    commits = pr_data.get('commits', [])
     latest_commits = commits[-3:] if len(commits) >= 3 else commits
     
-    completion_indicators = [
-        "Complete", "Ready for review", "Implementation complete", 
-        "Final", "Done", "Finished", "All requirements met",
-        "Feature complete", "Implementation done"
-    ]
-    
-    planning_indicators = [
-        "Initial plan", "WIP", "Work in progress", "Planning",
-        "Analysis", "Setup", "Preparation", "Initial"
-    ]
-    
     # Check recent commit messages
     has_completion = False
     has_planning = False
     
     for commit in latest_commits:
         msg = commit.get('messageHeadline', '').lower()
-        if any(indicator.lower() in msg for indicator in completion_indicators):
+        if _COMPLETION_RE.search(msg):
             has_completion = True
-        if any(indicator.lower() in msg for indicator in planning_indicators):
+        if _PLANNING_RE.search(msg):
             has_planning = True
     
-    # Get file changes to assess implementation depth
-    changes = get_pr_changes(pr_num)
-    detailed_changes = get_pr_detailed_changes(pr_num)
+    # Get file changes to assess implementation depth; the path list holds at
+    # most the first 100 files, so path-based checks only see those
+    files = pr_data.get('files', [])
+    changes = [f['path'] for f in files]
+    file_count = pr_data.get('changedFiles', len(changes))
+    detailed_changes = [
+        {"file": f['path'], "additions": f.get('additions', 0), "deletions": f.get('deletions', 0)}
+        for f in files
+    ]
     
     # Analyze change patterns
     has_real_implementation = False
     yarn_lock_only = False
     
-    if len(changes) == 1 and 'yarn.lock' in changes[0]:
+    if file_count == 1 and changes and 'yarn.lock' in changes[0]:
         yarn_lock_only = True
-    elif len(changes) > 1:
-        non_lock_files = [f for f in changes if 'yarn.lock' not in f and 'package-lock.json' not in f]
-        if non_lock_files:
-            has_real_implementation = True
+    elif file_count > 1:
+        has_real_implementation = any('yarn.lock' not in f and 'package-lock.json' not in f for f in changes)
     
     return {
         "has_completion_indicators": has_completion,
         "has_planning_indicators": has_planning,
         "yarn_lock_only": yarn_lock_only,
         "has_real_implementation": has_real_implementation,
-        "file_count": len(changes),
+        "file_count": file_count,
         "latest_commit_messages": [c.get('messageHeadline', '') for c in latest_commits],
         "changed_files": changes,
         "detailed_changes": detailed_changes
     }
 
-def get_pr_review_readiness_analysis(pr_num):
-    """Comprehensive analysis of whether a PR is ready for review."""
-    pr_data = get_pr_data(pr_num)
-    if not pr_data:
-        return {"error": "PR not found", "ready": False}
-    
-    readiness_check = check_pr_readiness(pr_num)
+def get_pr_review_readiness_analysis(pr_data):
+    """Comprehensive analysis of whether a PR is ready for review, computed from its batched PR data alone."""
+    pr_num = pr_data.get('number')
+    readiness_check = check_pr_readiness(pr_data)
     
     # Decision logic
     is_draft = pr_data.get('isDraft', False)